@@ -1,218 +1,363 @@
 #!/usr/bin/env python3
 
+import hashlib
 import json
+import math
+import mmap
 import os
+import pickle
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from statistics import fmean
+
+try:
+    import orjson  # Optional: much faster C parser, stdlib json is used otherwise
+except ImportError:
+    orjson = None
+
+# Shared stdlib decoder for the raw_decode fallbacks (it holds no per-call state)
+JSON_DECODER = json.JSONDecoder()
+
+# Parsed results are cached across runs, one index per results directory;
+# bump CACHE_VERSION when the result dict changes
+CACHE_HOME = os.environ.get('XDG_CACHE_HOME', '')
+if not os.path.isabs(CACHE_HOME):
+    # The XDG spec says empty or relative values are to be ignored
+    CACHE_HOME = Path.home() / '.cache'
+CACHE_DIR = Path(CACHE_HOME) / 'fairness_analysis'
+CACHE_VERSION = 3
+
+# Parsing fans out to a process pool only for batches big enough to repay its start-up
+PARALLEL_MIN_FILES = 2000
+PARALLEL_MIN_WORKERS = 4
+PARALLEL_CHUNKSIZE = 8
+
+# Test names look like <workload>_<cached|direct>, with _phase<N> appended for multi-phase runs
+TEST_NAME_RE = re.compile(r'^(?P<workload>.+?)_(?P<mode>cached|direct)(?:_(?P<phase>phase\d+))?$')
+
+# Report table row templates, bound once and reused for every row
+COMPARISON_ROW = "{:<20} {:<8} {:<12.0f} {:<10.1f} {:<10.1f}".format
+IMPROVEMENT_ROW = "{:<20} {:<8} {:<+12.1f}% {:<+9.1f}% {:<+9.1f}%".format
+PHASE_METRICS_ROW = "- {:7s} {:>10.0f} IOPS, {:>7.1f} MB/s, {:>7.1f}μs avg, {:>7.1f}μs p99, {:>8.1f}μs max".format
+
+# Workload-name substrings averaged in the KEY INSIGHTS section, grouped by heading
+IMPROVEMENT_CATEGORIES = (
+    ("### By Workload Type:", (('steady', 'Steady (1G file)'), ('bursty', 'Bursty (16G file)'))),
+    ("### By I/O Pattern:", (('reader', 'Readers'), ('writer', 'Writers'))),
+    ("### By I/O Depth:", (('d1', 'Depth=1'), ('d32', 'Depth=32'))),
+)
+
+
+def extract_metrics(job, test_name):
+    """Pull only the fields the analysis uses out of a FIO job entry."""
+    # The leaf paths are the same for every file, so they are spelled out flat
+    # here: each nested dict is looked up once and reused
+    read_metrics = job.get('read', {})
+    write_metrics = job.get('write', {})
+    read_lat = read_metrics.get('lat_ns', {})
+    write_lat = write_metrics.get('lat_ns', {})
+    # clat_ns (completion latency) is preferred for p99/max, with lat_ns as fallback
+    read_clat = read_metrics.get('clat_ns', {})
+    write_clat = write_metrics.get('clat_ns', {})
+
+    read_iops = read_metrics.get('iops', 0)
+    write_iops = write_metrics.get('iops', 0)
+    read_bw = read_metrics.get('bw_bytes', 0)
+    write_bw = write_metrics.get('bw_bytes', 0)
+    # Per-second IOPS spread comes from whichever direction did the work
+    active = read_metrics if read_iops > 0 else write_metrics
+
+    read_p99 = (read_clat.get('percentile', {}).get('99.000000', 0) or
+                read_lat.get('percentile', {}).get('99.000000', 0))
+    write_p99 = (write_clat.get('percentile', {}).get('99.000000', 0) or
+                 write_lat.get('percentile', {}).get('99.000000', 0))
+    read_max = read_clat['max'] if 'max' in read_clat else read_lat.get('max', 0)
+    write_max = write_clat['max'] if 'max' in write_clat else write_lat.get('max', 0)
+
+    read_bw_mbs = read_bw / 1024 / 1024
+    write_bw_mbs = write_bw / 1024 / 1024
+    read_lat_us = read_lat.get('mean', 0) / 1000
+    write_lat_us = write_lat.get('mean', 0) / 1000
+    read_p99_us = read_p99 / 1000
+    write_p99_us = write_p99 / 1000
+    read_max_us = read_max / 1000
+    write_max_us = write_max / 1000
+    is_read = read_iops > 0
+
+    return {
+        'test_name': test_name,
+
+        # IOPS
+        'read_iops': read_iops,
+        'write_iops': write_iops,
+        'iops_min': active.get('iops_min', 0),
+        'iops_max': active.get('iops_max', 0),
+        'iops_stddev': active.get('iops_stddev', 0),
+
+        # Bandwidth (MB/s)
+        'read_bw_mbs': read_bw_mbs,
+        'write_bw_mbs': write_bw_mbs,
+
+        # Latency (microseconds)
+        'read_lat_avg_us': read_lat_us,
+        'write_lat_avg_us': write_lat_us,
+        'read_lat_p99_us': read_p99_us,
+        'write_lat_p99_us': write_p99_us,
+        'read_lat_max_us': read_max_us,
+        'write_lat_max_us': write_max_us,
+
+        # Effective values for the direction that did the work (read if any reads)
+        'iops': read_iops if is_read else write_iops,
+        'bw_mbs': read_bw_mbs if is_read else write_bw_mbs,
+        'lat_us': read_lat_us if is_read else write_lat_us,
+        'lat_p99_us': read_p99_us if is_read else write_p99_us,
+        'lat_max_us': read_max_us if is_read else write_max_us,
+    }
+
+
+def decode_json_stream(raw):
+    """Helper: Decode concatenated JSON objects, returning the last dict (most recent run)."""
+    # Fast path: a single JSON object per file (the common case)
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    # Handle multiple JSON objects in one file
+    content = str(raw, 'utf-8')
+    data = None
+    idx = 0
+    end = len(content)
+    while idx < end:
+        # Advance a single offset rather than re-slicing the remaining text
+        while idx < end and content[idx] in ' \t\r\n':
+            idx += 1
+        if idx >= end:
+            break
+        try:
+            obj, idx = JSON_DECODER.raw_decode(content, idx)
+            if isinstance(obj, dict):
+                data = obj
+        except json.JSONDecodeError:
+            break
 
+    return data
 
-def load_fio_results(results_dir):
-    """Load FIO benchmark results from JSON files."""
-    results_path = Path(results_dir)
-    json_files = list(results_path.glob("*.json"))
-    results = []
 
-    for json_file in json_files:
+def decode_first_json_object(raw):
+    """Helper: Decode the JSON object at the start of raw, ignoring anything after it."""
+    if orjson is not None:
         try:
-            with open(json_file, 'r') as f:
-                content = f.read()
-
-            # Handle multiple JSON objects in one file
-            json_objects = []
-            decoder = json.JSONDecoder()
-            idx = 0
-            content_to_parse = content
-            while idx < len(content_to_parse):
-                remaining = content_to_parse[idx:].lstrip()
-                if not remaining:
-                    break
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    obj, _ = JSON_DECODER.raw_decode(str(raw, 'utf-8'))
+    return obj
+
+
+def decode_last_json_object(buf):
+    """Helper: Decode only the last top-level JSON object in buf (most recent run)."""
+    # Parsers read slices of the mapping directly instead of a bytes copy;
+    # the views are released on exit, even on error, so the mmap can close
+    with memoryview(buf) as view:
+        # FIO pretty-prints each run with its opening brace at column 0, so walk
+        # those candidates back from the end and decode the first one that parses
+        end = len(buf)
+        while True:
+            start = buf.rfind(b'\n{', 0, end) + 1
+            if start == 0:
+                # Reached the first run: fall back to a forward scan of the whole file
+                return decode_json_stream(view)
+            with view[start:] as tail:
                 try:
-                    obj, end_idx = decoder.raw_decode(remaining)
-                    if isinstance(obj, dict):
-                        json_objects.append(obj)
-                    idx += len(content_to_parse[idx:]) - len(remaining) + end_idx
-                except json.JSONDecodeError:
-                    break
-
-            # Use the last JSON object (most recent run)
-            if not json_objects:
-                continue
-
-            data = json_objects[-1]
-
-            if not isinstance(data, dict) or 'jobs' not in data or not data['jobs']:
-                continue
-
-            job = data['jobs'][0]
-            test_name = json_file.stem
-
-            # Extract metrics
-            read_metrics = job.get('read', {})
-            write_metrics = job.get('write', {})
-
-            # Helper to get p99 from clat_ns or lat_ns
-            def get_p99_ns(metrics):
-                # Try clat_ns first (completion latency - most common)
-                clat = metrics.get('clat_ns', {})
-                if 'percentile' in clat:
-                    p99 = clat['percentile'].get('99.000000', 0)
-                    if p99 > 0:
-                        return p99
-
-                # Fallback to lat_ns
-                lat = metrics.get('lat_ns', {})
-                if 'percentile' in lat:
-                    return lat['percentile'].get('99.000000', 0)
-
-                return 0
-
-            # Helper to get max from clat_ns or lat_ns
-            def get_max_ns(metrics):
-                # Try clat_ns first (completion latency - most common)
-                clat = metrics.get('clat_ns', {})
-                if 'max' in clat:
-                    return clat['max']
-
-                # Fallback to lat_ns
-                lat = metrics.get('lat_ns', {})
-                if 'max' in lat:
-                    return lat['max']
+                    data = decode_first_json_object(tail)
+                    if isinstance(data, dict):
+                        return data
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass
+            end = start - 1
+
+
+def parse_fio_file(json_file):
+    """Parse one FIO JSON file into a result dict, or None if it has no usable run."""
+    try:
+        with open(json_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Files from runs that never reported have no jobs; skip them unparsed
+                if mm.find(b'"jobs"') == -1:
+                    return None
+                data = decode_last_json_object(mm)
+
+        if not isinstance(data, dict) or 'jobs' not in data or not data['jobs']:
+            return None
+
+        # Only the first job's leaf metrics are kept; the parsed tree is dropped
+        test_name = os.path.splitext(os.path.basename(json_file))[0]
+        return extract_metrics(data['jobs'][0], test_name)
+
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, FileNotFoundError) as e:
+        print(f"Warning: Could not parse {json_file}: {e}")
+        return None
+
+
+def result_cache_file(results_dir):
+    """Helper: Path of the cache index for a results directory."""
+    digest = hashlib.sha1(os.path.abspath(results_dir).encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def load_result_cache(cache_file):
+    """Helper: Load cached parse results, keyed by file name."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        # A missing or unreadable cache is just a miss
+        return {}
+
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache['entries']
+
+
+def save_result_cache(cache_file, entries):
+    """Helper: Persist cached parse results, ignoring write failures."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'entries': entries}, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}")
 
-                return 0
-
-            result = {
-                'test_name': test_name,
-                'file_path': str(json_file),
-
-                # IOPS
-                'read_iops': read_metrics.get('iops', 0),
-                'write_iops': write_metrics.get('iops', 0),
-                'total_iops': read_metrics.get('iops', 0) + write_metrics.get('iops', 0),
-                'iops_min': read_metrics.get('iops_min', 0) if read_metrics.get('iops', 0) > 0 else write_metrics.get('iops_min', 0),
-                'iops_max': read_metrics.get('iops_max', 0) if read_metrics.get('iops', 0) > 0 else write_metrics.get('iops_max', 0),
-                'iops_stddev': read_metrics.get('iops_stddev', 0) if read_metrics.get('iops', 0) > 0 else write_metrics.get('iops_stddev', 0),
-
-                # Bandwidth (MB/s)
-                'read_bw_mbs': read_metrics.get('bw_bytes', 0) / 1024 / 1024,
-                'write_bw_mbs': write_metrics.get('bw_bytes', 0) / 1024 / 1024,
-                'total_bw_mbs': (read_metrics.get('bw_bytes', 0) + write_metrics.get('bw_bytes', 0)) / 1024 / 1024,
-
-                # Latency (microseconds)
-                'read_lat_avg_us': read_metrics.get('lat_ns', {}).get('mean', 0) / 1000,
-                'write_lat_avg_us': write_metrics.get('lat_ns', {}).get('mean', 0) / 1000,
-                'read_lat_p99_us': get_p99_ns(read_metrics) / 1000,
-                'write_lat_p99_us': get_p99_ns(write_metrics) / 1000,
-                'read_lat_max_us': get_max_ns(read_metrics) / 1000,
-                'write_lat_max_us': get_max_ns(write_metrics) / 1000,
-            }
-
-            results.append(result)
-
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-            print(f"Warning: Could not parse {json_file}: {e}")
-
-    return results
-
-
-def get_iops(result):
-    """Helper: Get IOPS from result (read or write)."""
-    return result['read_iops'] if result['read_iops'] > 0 else result['write_iops']
-
-
-def get_bw(result):
-    """Helper: Get bandwidth from result (read or write)."""
-    return result['read_bw_mbs'] if result['read_iops'] > 0 else result['write_bw_mbs']
 
+def load_fio_results(results_dir):
+    """Load FIO benchmark results from JSON files."""
+    # scandir hands back names and file types without building Path objects
+    try:
+        with os.scandir(results_dir) as it:
+            dir_entries = sorted((e for e in it if e.name.endswith('.json') and e.is_file()),
+                                 key=lambda e: e.name)
+    except OSError:
+        # Missing, not a directory, or unreadable: no results, as with Path.glob
+        return []
+    json_files = [dir_entry.path for dir_entry in dir_entries]
+
+    # Reuse results for files unchanged since the last run, keyed by (mtime, size).
+    # The index is rebuilt from this scan, so deleted or renamed files drop out
+    cache_file = result_cache_file(results_dir)
+    old_cache = load_result_cache(cache_file)
+    cache = {}
+    parsed = [None] * len(json_files)
+    stale = []
+    for i, dir_entry in enumerate(dir_entries):
+        try:
+            stat = dir_entry.stat()
+        except FileNotFoundError:
+            continue
+        name = dir_entry.name
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = old_cache.get(name)
+        if entry is not None and entry[0] == key:
+            parsed[i] = entry[1]
+            cache[name] = entry
+        else:
+            stale.append((i, name, key))
 
-def get_lat(result):
-    """Helper: Get latency from result (read or write)."""
-    return result['read_lat_avg_us'] if result['read_iops'] > 0 else result['write_lat_avg_us']
+    stale_files = [json_files[i] for i, _, _ in stale]
 
+    # Files are independent, but a parse costs about as much as shipping it to a
+    # worker, so only large batches on several cores are worth a process pool
+    workers = min(os.cpu_count() or 1, math.ceil(len(stale_files) / PARALLEL_CHUNKSIZE))
+    if len(stale_files) >= PARALLEL_MIN_FILES and workers >= PARALLEL_MIN_WORKERS:
+        sys.stdout.flush()  # Don't let forked workers inherit unflushed output
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fresh = list(executor.map(parse_fio_file, stale_files, chunksize=PARALLEL_CHUNKSIZE))
+    else:
+        fresh = [parse_fio_file(json_file) for json_file in stale_files]
 
-def get_lat_p99(result):
-    """Helper: Get p99 latency from result (read or write)."""
-    return result['read_lat_p99_us'] if result['read_iops'] > 0 else result['write_lat_p99_us']
+    for (i, name, key), result in zip(stale, fresh):
+        parsed[i] = result
+        if result:
+            cache[name] = (key, result)
 
+    if cache != old_cache:
+        save_result_cache(cache_file, cache)
 
-def get_lat_max(result):
-    """Helper: Get max latency from result (read or write)."""
-    return result['read_lat_max_us'] if result['read_iops'] > 0 else result['write_lat_max_us']
+    return [result for result in parsed if result]
 
 
-def calculate_average_iops(phases):
-    """Helper: Calculate average IOPS across all phases."""
-    total = sum(get_iops(p) for p in phases.values())
-    return total / len(phases) if phases else 0
+def write_report(lines):
+    """Helper: Write buffered report lines to stdout with a single write."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def print_phase_metrics(result, label):
-    """Helper: Print metrics for a phase result."""
-    iops = get_iops(result)
-    bw = get_bw(result)
-    lat = get_lat(result)
-    lat_p99 = get_lat_p99(result)
-    lat_max = get_lat_max(result)
-    print(f"- {label:7s} {iops:>10.0f} IOPS, {bw:>7.1f} MB/s, {lat:>7.1f}μs avg, {lat_p99:>7.1f}μs p99, {lat_max:>8.1f}μs max")
+def format_phase_metrics(result, label):
+    """Helper: Format metrics for a phase result as a report line."""
+    return PHASE_METRICS_ROW(label, result['iops'], result['bw_mbs'], result['lat_us'],
+                             result['lat_p99_us'], result['lat_max_us'])
 
 
 def analyze_fairness_results(results_dir):
     """Quick analysis of fairness results without external dependencies."""
     results_path = Path(results_dir)
 
-    print("# 🎯 FAIRNESS BENCHMARK ANALYSIS")
-    print("=" * 50)
+    # Report lines are collected and written in one go at the end
+    out = []
+    out.append("# 🎯 FAIRNESS BENCHMARK ANALYSIS")
+    out.append("=" * 50)
 
     # Load results
     results = load_fio_results(results_dir)
     if not results:
-        print("No results found!")
+        out.append("No results found!")
+        write_report(out)
         return
 
-    print(f"**Total Tests:** {len(results)}")
-    print()
+    out.append(f"**Total Tests:** {len(results)}")
+    out.append('')
 
     # Group results by workload
-    workloads = {}
-    phase_results = {}
+    workloads = defaultdict(dict)
+    phase_results = defaultdict(lambda: defaultdict(dict))
 
     for result in results:
-        test_name = result['test_name']
+        # Extract: workload_name_cached[_phase1] -> workload_name, cached, phase1
+        match = TEST_NAME_RE.match(result['test_name'])
+        if not match:
+            continue
+
+        # Interned so the grouping dicts below compare keys by identity
+        workload_name = sys.intern(match['workload'])
+        cache_mode = sys.intern(match['mode'])
+        phase_num = match['phase']
 
         # Check if this is a phase result
-        if '_phase' in test_name:
-            # Extract: workload_name_cached_phase1 -> workload_name, cached, phase1
-            parts = test_name.split('_')
-            phase_num = parts[-1]  # phase1, phase2, etc.
-            cache_mode = parts[-2]  # cached or direct
-            workload_name = '_'.join(parts[:-2])  # everything before cache_mode_phaseN
-
-            if workload_name not in phase_results:
-                phase_results[workload_name] = {}
-            if cache_mode not in phase_results[workload_name]:
-                phase_results[workload_name][cache_mode] = {}
+        if phase_num:
             phase_results[workload_name][cache_mode][phase_num] = result
             continue
 
         # Regular workload (not phase)
-        if test_name.endswith('_cached') or test_name.endswith('_direct'):
-            workload_name = test_name.rsplit('_', 1)[0]
-            cache_mode = test_name.rsplit('_', 1)[1]
-        else:
-            continue
-
-        if workload_name not in workloads:
-            workloads[workload_name] = {}
-
         workloads[workload_name][cache_mode] = result
 
     # Only show workload comparison if non-phase workloads exist
     if workloads:
-        print("## 📊 WORKLOAD PERFORMANCE COMPARISON")
-        print()
-        print(f"{'Workload':<20} {'Mode':<8} {'IOPS':<12} {'BW(MB/s)':<10} {'Lat(μs)':<10}")
-        print("-" * 65)
+        out.append("## 📊 WORKLOAD PERFORMANCE COMPARISON")
+        out.append('')
+        out.append(f"{'Workload':<20} {'Mode':<8} {'IOPS':<12} {'BW(MB/s)':<10} {'Lat(μs)':<10}")
+        out.append("-" * 65)
 
-        improvements = []
+        # Improvements are kept column-wise; only the IOPS column is aggregated
+        improved_workloads = []
+        iops_improvements = []
 
         for workload_name in sorted(workloads.keys()):
             modes = workloads[workload_name]
@@ -221,15 +366,15 @@ def analyze_fairness_results(results_dir):
                 cached = modes['cached']
                 direct = modes['direct']
 
-                cached_iops = get_iops(cached)
-                cached_bw = get_bw(cached)
-                cached_lat = get_lat(cached)
-                direct_iops = get_iops(direct)
-                direct_bw = get_bw(direct)
-                direct_lat = get_lat(direct)
+                cached_iops = cached['iops']
+                cached_bw = cached['bw_mbs']
+                cached_lat = cached['lat_us']
+                direct_iops = direct['iops']
+                direct_bw = direct['bw_mbs']
+                direct_lat = direct['lat_us']
 
-                print(f"{workload_name:<20} {'cached':<8} {cached_iops:<12.0f} {cached_bw:<10.1f} {cached_lat:<10.1f}")
-                print(f"{'':20} {'direct':<8} {direct_iops:<12.0f} {direct_bw:<10.1f} {direct_lat:<10.1f}")
+                out.append(COMPARISON_ROW(workload_name, 'cached', cached_iops, cached_bw, cached_lat))
+                out.append(COMPARISON_ROW('', 'direct', direct_iops, direct_bw, direct_lat))
 
                 # Calculate improvements
                 if direct_iops > 0:
@@ -237,79 +382,56 @@ def analyze_fairness_results(results_dir):
                     bw_improvement = (cached_bw - direct_bw) / direct_bw * 100
                     lat_improvement = (direct_lat - cached_lat) / direct_lat * 100 if direct_lat > 0 else 0
 
-                    print(f"{'':20} {'improve':<8} {iops_improvement:<+12.1f}% {bw_improvement:<+9.1f}% {lat_improvement:<+9.1f}%")
-
-                    improvements.append({
-                        'workload': workload_name,
-                        'iops_imp': iops_improvement,
-                        'bw_imp': bw_improvement,
-                        'lat_imp': lat_improvement
-                    })
-
-                print("-" * 65)
-
-        if improvements:
-            print()
-            print("## 🔍 KEY INSIGHTS")
-            print()
-
-            # Category analysis
-            steady_improvements = [imp for imp in improvements if 'steady' in imp['workload']]
-            bursty_improvements = [imp for imp in improvements if 'bursty' in imp['workload']]
-            reader_improvements = [imp for imp in improvements if 'reader' in imp['workload']]
-            writer_improvements = [imp for imp in improvements if 'writer' in imp['workload']]
-            d1_improvements = [imp for imp in improvements if 'd1' in imp['workload']]
-            d32_improvements = [imp for imp in improvements if 'd32' in imp['workload']]
-
-            print("### By Workload Type:")
-            if steady_improvements:
-                avg_steady = sum(imp['iops_imp'] for imp in steady_improvements) / len(steady_improvements)
-                print(f"- **Steady (1G file):** {avg_steady:+.1f}% average IOPS improvement")
-
-            if bursty_improvements:
-                avg_bursty = sum(imp['iops_imp'] for imp in bursty_improvements) / len(bursty_improvements)
-                print(f"- **Bursty (16G file):** {avg_bursty:+.1f}% average IOPS improvement")
-
-            print()
-            print("### By I/O Pattern:")
-            if reader_improvements:
-                avg_read = sum(imp['iops_imp'] for imp in reader_improvements) / len(reader_improvements)
-                print(f"- **Readers:** {avg_read:+.1f}% average IOPS improvement")
-
-            if writer_improvements:
-                avg_write = sum(imp['iops_imp'] for imp in writer_improvements) / len(writer_improvements)
-                print(f"- **Writers:** {avg_write:+.1f}% average IOPS improvement")
-
-            print()
-            print("### By I/O Depth:")
-            if d1_improvements:
-                avg_d1 = sum(imp['iops_imp'] for imp in d1_improvements) / len(d1_improvements)
-                print(f"- **Depth=1:** {avg_d1:+.1f}% average IOPS improvement")
-
-            if d32_improvements:
-                avg_d32 = sum(imp['iops_imp'] for imp in d32_improvements) / len(d32_improvements)
-                print(f"- **Depth=32:** {avg_d32:+.1f}% average IOPS improvement")
+                    out.append(IMPROVEMENT_ROW('', 'improve', iops_improvement, bw_improvement, lat_improvement))
+
+                    improved_workloads.append(workload_name)
+                    iops_improvements.append(iops_improvement)
+
+                out.append("-" * 65)
+
+        if iops_improvements:
+            out.append('')
+            out.append("## 🔍 KEY INSIGHTS")
+            out.append('')
+
+            # Category analysis: bucket every improvement in a single pass
+            category_improvements = {category: []
+                                     for _, categories in IMPROVEMENT_CATEGORIES
+                                     for category, _ in categories}
+            for workload, imp in zip(improved_workloads, iops_improvements):
+                for category, values in category_improvements.items():
+                    if category in workload:
+                        values.append(imp)
+
+            for section, (heading, categories) in enumerate(IMPROVEMENT_CATEGORIES):
+                if section:
+                    out.append('')
+                out.append(heading)
+                for category, label in categories:
+                    values = category_improvements[category]
+                    if values:
+                        out.append(f"- **{label}:** {fmean(values):+.1f}% average IOPS improvement")
 
             # Best and worst
-            best = max(improvements, key=lambda x: x['iops_imp'])
-            worst = min(improvements, key=lambda x: x['iops_imp'])
+            best = max(range(len(iops_improvements)), key=iops_improvements.__getitem__)
+            worst = min(range(len(iops_improvements)), key=iops_improvements.__getitem__)
 
-            print()
-            print("### Performance Extremes:")
-            print(f"- **Best pagecache benefit:** {best['workload']} ({best['iops_imp']:+.1f}% IOPS)")
-            print(f"- **Least pagecache benefit:** {worst['workload']} ({worst['iops_imp']:+.1f}% IOPS)")
+            out.append('')
+            out.append("### Performance Extremes:")
+            out.append(f"- **Best pagecache benefit:** {improved_workloads[best]} ({iops_improvements[best]:+.1f}% IOPS)")
+            out.append(f"- **Least pagecache benefit:** {improved_workloads[worst]} ({iops_improvements[worst]:+.1f}% IOPS)")
 
-            overall_avg = sum(imp['iops_imp'] for imp in improvements) / len(improvements)
-            print(f"- **Overall average:** {overall_avg:+.1f}% IOPS improvement")
+            overall_avg = fmean(iops_improvements)
+            out.append(f"- **Overall average:** {overall_avg:+.1f}% IOPS improvement")
 
     # Add phase-by-phase analysis if any multi-phase workloads exist
     if phase_results:
-        print()
-        print("## 🔄 MULTI-PHASE WORKLOAD ANALYSIS")
-        print()
+        out.append('')
+        out.append("## 🔄 MULTI-PHASE WORKLOAD ANALYSIS")
+        out.append('')
         for workload_name in sorted(phase_results.keys()):
-            print(f"### {workload_name} (Phase-by-Phase)")
-            print()
+            out.append(f"### {workload_name} (Phase-by-Phase)")
+            out.append('')
             phases = phase_results[workload_name]
 
             # Get all phase numbers
@@ -320,175 +442,171 @@ def analyze_fairness_results(results_dir):
                 all_phases.update(phases['direct'].keys())
 
             for phase_num in sorted(all_phases):
-                print(f"**{phase_num.upper()}:**")
+                out.append(f"**{phase_num.upper()}:**")
 
                 if 'cached' in phases and phase_num in phases['cached']:
-                    print_phase_metrics(phases['cached'][phase_num], "Cached:")
+                    out.append(format_phase_metrics(phases['cached'][phase_num], "Cached:"))
 
                 if 'direct' in phases and phase_num in phases['direct']:
-                    print_phase_metrics(phases['direct'][phase_num], "Direct:")
+                    out.append(format_phase_metrics(phases['direct'][phase_num], "Direct:"))
 
                 # Calculate improvement for this phase
                 if ('cached' in phases and phase_num in phases['cached'] and
                     'direct' in phases and phase_num in phases['direct']):
-                    cached_iops = get_iops(phases['cached'][phase_num])
-                    direct_iops = get_iops(phases['direct'][phase_num])
+                    cached_iops = phases['cached'][phase_num]['iops']
+                    direct_iops = phases['direct'][phase_num]['iops']
 
                     if direct_iops > 0:
                         improvement = (cached_iops - direct_iops) / direct_iops * 100
-                        print(f"- Improvement: {improvement:+.1f}%")
+                        out.append(f"- Improvement: {improvement:+.1f}%")
 
-                print()
+                out.append('')
 
     # Add comprehensive fairness and stability analysis for dual-client mode
     if phase_results and 'client1' in phase_results and 'client2' in phase_results:
-        print()
-        print("## ⚖️  DUAL-CLIENT FAIRNESS & STABILITY ANALYSIS")
-        print("=" * 75)
-
-        # Phase stability analysis
-        print("\n### Phase Stability Analysis")
-        print("-" * 75)
-
-        stability_summary = []
+        out.append('')
+        out.append("## ⚖️  DUAL-CLIENT FAIRNESS & STABILITY ANALYSIS")
+        out.append("=" * 75)
 
+        # Single traversal of the client phases; every section below reads from here
+        client_stats = {}
         for client_name in ['client1', 'client2']:
-            if client_name not in phase_results:
-                continue
-
-            client_phases = phase_results[client_name]
-
             for cache_mode in ['cached', 'direct']:
-                if cache_mode not in client_phases:
+                if cache_mode not in phase_results[client_name]:
                     continue
 
-                phases = client_phases[cache_mode]
+                phases = phase_results[client_name][cache_mode]
                 phase_keys = sorted(phases.keys())
+                phase_iops = [phases[phase_key]['iops'] for phase_key in phase_keys]
+                client_stats[(client_name, cache_mode)] = {
+                    'phase_keys': phase_keys,
+                    'phase_iops': phase_iops,
+                    'iops_stddev': [phases[phase_key]['iops_stddev'] for phase_key in phase_keys],
+                    'avg_iops': fmean(phase_iops),
+                }
 
-                if len(phase_keys) < 2:
-                    continue
+        # Phase stability analysis
+        out.append("\n### Phase Stability Analysis")
+        out.append("-" * 75)
 
-                # Get IOPS for first and last phase
-                p1_iops = get_iops(phases[phase_keys[0]])
-                p2_iops = get_iops(phases[phase_keys[-1]])
-
-                if p1_iops > 0:
-                    change_pct = ((p2_iops - p1_iops) / p1_iops) * 100
-                    stability_summary.append({
-                        'name': f"{client_name.title()} {cache_mode.title()}",
-                        'change': change_pct,
-                        'abs_change': abs(change_pct),
-                        'p1_iops': p1_iops,
-                        'p2_iops': p2_iops
-                    })
-
-                    print(f"\n**{client_name.upper()} {cache_mode.upper()}:**")
-                    print(f"  Phase1: {p1_iops:>12,.0f} IOPS")
-                    print(f"  Phase2: {p2_iops:>12,.0f} IOPS")
-                    print(f"  Change: {change_pct:>12.2f}%")
-
-                    if abs(change_pct) < 1:
-                        print(f"  ✅ Excellent stability (< 1% variation)")
-                    elif abs(change_pct) < 5:
-                        print(f"  ✓ Good stability (< 5% variation)")
-                    else:
-                        print(f"  ⚠️  Poor stability (> 5% variation)")
+        stability_summary = []
+
+        for (client_name, cache_mode), stats in client_stats.items():
+            phase_iops = stats['phase_iops']
+            if len(phase_iops) < 2:
+                continue
+
+            # Get IOPS for first and last phase
+            p1_iops = phase_iops[0]
+            p2_iops = phase_iops[-1]
+
+            if p1_iops > 0:
+                change_pct = ((p2_iops - p1_iops) / p1_iops) * 100
+                stability_summary.append({
+                    'name': f"{client_name.title()} {cache_mode.title()}",
+                    'change': change_pct,
+                    'abs_change': abs(change_pct),
+                    'p1_iops': p1_iops,
+                    'p2_iops': p2_iops
+                })
+
+                out.append(f"\n**{client_name.upper()} {cache_mode.upper()}:**")
+                out.append(f"  Phase1: {p1_iops:>12,.0f} IOPS")
+                out.append(f"  Phase2: {p2_iops:>12,.0f} IOPS")
+                out.append(f"  Change: {change_pct:>12.2f}%")
+
+                if abs(change_pct) < 1:
+                    out.append(f"  ✅ Excellent stability (< 1% variation)")
+                elif abs(change_pct) < 5:
+                    out.append(f"  ✓ Good stability (< 5% variation)")
+                else:
+                    out.append(f"  ⚠️  Poor stability (> 5% variation)")
 
         # Stability ranking
         if stability_summary:
-            print("\n### Stability Ranking (Most Unstable → Most Stable)")
-            print("-" * 75)
+            out.append("\n### Stability Ranking (Most Unstable → Most Stable)")
+            out.append("-" * 75)
             stability_summary.sort(key=lambda x: x['abs_change'], reverse=True)
 
             for i, item in enumerate(stability_summary, 1):
                 status = "⚠️ " if item['abs_change'] > 5 else "✓" if item['abs_change'] > 1 else "✅"
-                print(f"{i}. {status} {item['name']:25s}: {item['change']:+7.2f}%")
+                out.append(f"{i}. {status} {item['name']:25s}: {item['change']:+7.2f}%")
 
         # Client comparison (fairness)
-        print("\n\n### Client Fairness Comparison")
-        print("-" * 75)
+        out.append("\n\n### Client Fairness Comparison")
+        out.append("-" * 75)
 
         for cache_mode in ['cached', 'direct']:
-            if ('client1' in phase_results and cache_mode in phase_results['client1'] and
-                'client2' in phase_results and cache_mode in phase_results['client2']):
-
-                c1_avg = calculate_average_iops(phase_results['client1'][cache_mode])
-                c2_avg = calculate_average_iops(phase_results['client2'][cache_mode])
+            if ('client1', cache_mode) in client_stats and ('client2', cache_mode) in client_stats:
+                c1_avg = client_stats[('client1', cache_mode)]['avg_iops']
+                c2_avg = client_stats[('client2', cache_mode)]['avg_iops']
 
                 if c2_avg > 0:
                     ratio = c1_avg / c2_avg
 
-                    print(f"\n**{cache_mode.upper()} MODE:**")
-                    print(f"  Client1 avg: {c1_avg:>12,.0f} IOPS")
-                    print(f"  Client2 avg: {c2_avg:>12,.0f} IOPS")
-                    print(f"  Ratio:       {ratio:>12.2f}x")
+                    out.append(f"\n**{cache_mode.upper()} MODE:**")
+                    out.append(f"  Client1 avg: {c1_avg:>12,.0f} IOPS")
+                    out.append(f"  Client2 avg: {c2_avg:>12,.0f} IOPS")
+                    out.append(f"  Ratio:       {ratio:>12.2f}x")
 
                     if abs(ratio - 1.0) < 0.1:
-                        print(f"  ✅ Excellent fairness (~1:1 ratio)")
+                        out.append(f"  ✅ Excellent fairness (~1:1 ratio)")
                     elif abs(ratio - 1.0) < 0.5:
-                        print(f"  ✓ Good fairness")
+                        out.append(f"  ✓ Good fairness")
                     else:
-                        print(f"  ⚠️  Unfair resource distribution")
+                        out.append(f"  ⚠️  Unfair resource distribution")
 
         # Variance analysis (intra-phase stability)
-        print("\n\n### Intra-Phase Variance Analysis")
-        print("-" * 75)
-        print("Measures performance consistency WITHIN each 30-second phase\n")
+        out.append("\n\n### Intra-Phase Variance Analysis")
+        out.append("-" * 75)
+        out.append("Measures performance consistency WITHIN each 30-second phase\n")
 
         for client_name in ['client1', 'client2']:
-            if client_name not in phase_results:
-                continue
-
-            client_phases = phase_results[client_name]
-            print(f"\n**{client_name.upper()}:**")
+            out.append(f"\n**{client_name.upper()}:**")
 
             for cache_mode in ['cached', 'direct']:
-                if cache_mode not in client_phases:
+                stats = client_stats.get((client_name, cache_mode))
+                if stats is None:
                     continue
 
-                print(f"  {cache_mode.title()}:")
-
-                for phase_key in sorted(client_phases[cache_mode].keys()):
-                    phase = client_phases[cache_mode][phase_key]
-                    iops = get_iops(phase)
-                    iops_stddev = phase['iops_stddev']
+                out.append(f"  {cache_mode.title()}:")
 
+                for phase_key, iops, iops_stddev in zip(stats['phase_keys'], stats['phase_iops'],
+                                                        stats['iops_stddev']):
                     if iops > 0:
                         cv = (iops_stddev / iops) * 100  # Coefficient of variation
-                        print(f"    {phase_key}: CoV = {cv:>5.2f}% (σ={iops_stddev:>8,.0f} IOPS)")
+                        out.append(f"    {phase_key}: CoV = {cv:>5.2f}% (σ={iops_stddev:>8,.0f} IOPS)")
 
         # Pagecache benefit comparison
-        print("\n\n### Pagecache Benefit Analysis")
-        print("-" * 75)
+        out.append("\n\n### Pagecache Benefit Analysis")
+        out.append("-" * 75)
 
         for client_name in ['client1', 'client2']:
-            if client_name not in phase_results:
-                continue
-
-            if 'cached' not in phase_results[client_name] or 'direct' not in phase_results[client_name]:
+            if (client_name, 'cached') not in client_stats or (client_name, 'direct') not in client_stats:
                 continue
 
-            cached_avg = calculate_average_iops(phase_results[client_name]['cached'])
-            direct_avg = calculate_average_iops(phase_results[client_name]['direct'])
+            cached_avg = client_stats[(client_name, 'cached')]['avg_iops']
+            direct_avg = client_stats[(client_name, 'direct')]['avg_iops']
 
             if direct_avg > 0:
                 benefit_pct = ((cached_avg - direct_avg) / direct_avg) * 100
 
-                print(f"\n**{client_name.upper()}:**")
-                print(f"  Cached avg:  {cached_avg:>12,.0f} IOPS")
-                print(f"  Direct avg:  {direct_avg:>12,.0f} IOPS")
-                print(f"  Benefit:     {benefit_pct:>12.2f}%")
+                out.append(f"\n**{client_name.upper()}:**")
+                out.append(f"  Cached avg:  {cached_avg:>12,.0f} IOPS")
+                out.append(f"  Direct avg:  {direct_avg:>12,.0f} IOPS")
+                out.append(f"  Benefit:     {benefit_pct:>12.2f}%")
 
                 if benefit_pct < -10:
-                    print(f"  ⚠️  Pagecache HURTS performance significantly")
+                    out.append(f"  ⚠️  Pagecache HURTS performance significantly")
                 elif benefit_pct < 0:
-                    print(f"  ⚠️  Pagecache slightly degrades performance")
+                    out.append(f"  ⚠️  Pagecache slightly degrades performance")
                 elif benefit_pct < 10:
-                    print(f"  ✓ Modest pagecache benefit")
+                    out.append(f"  ✓ Modest pagecache benefit")
                 else:
-                    print(f"  ✅ Strong pagecache benefit")
+                    out.append(f"  ✅ Strong pagecache benefit")
 
-    print()
+    out.append('')
+    write_report(out)
 
 
 def main():